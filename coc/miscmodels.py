@@ -26,7 +26,7 @@ from typing import Any, Type, TypeVar, Optional
 
 import coc
 from .enums import ExtendedEnum, PlayerHouseElementType
-from .utils import from_timestamp
+from .utils import cached_property, from_timestamp
 
 T = TypeVar("T")
 
@@ -526,7 +526,7 @@ class Timestamp:
         :class:`str`: The raw timestamp string (ISO8601) as given by the API.
     """
 
-    __slots__ = ("raw_time", "_data")
+    __slots__ = ("raw_time", "_data", "_cs_time")
 
     def __repr__(self):
         attrs = [("time", self.time), ("seconds_until", self.seconds_until)]
@@ -550,7 +550,7 @@ class Timestamp:
     def __init__(self, *, data):
         self.raw_time = data
 
-    @property
+    @cached_property("_cs_time")
     def time(self) -> datetime:
         """:class:`datetime`: Returns the timestamp as a UTC datetime object."""
         return from_timestamp(self.raw_time)
@@ -23,11 +23,17 @@ SOFTWARE.
 """
 import typing
 
+from operator import itemgetter
+from sys import intern
+
 if typing.TYPE_CHECKING:
     # pylint: disable=cyclic-import
     from .war_members import ClanWarMember
 
 
+_ATTACK_FIELDS = itemgetter("stars", "destructionPercentage", "order", "attackerTag", "defenderTag", "duration")
+
+
 class WarAttack:
     """Represents a Clash of Clans War Attack
 
@@ -50,7 +56,6 @@ class WarAttack:
     """
 
     __slots__ = ("war",
-                 "member",
                  "stars",
                  "destruction",
                  "order",
@@ -97,12 +102,14 @@ class WarAttack:
         self._from_data(data)
 
     def _from_data(self, data: dict) -> None:
-        self.stars: int = data["stars"]
-        self.destruction: float = data["destructionPercentage"]
-        self.order: int = data["order"]
-        self.attacker_tag: str = data["attackerTag"]
-        self.defender_tag: str = data["defenderTag"]
-        self.duration: float = data["duration"]
+        stars, destruction, order, attacker_tag, defender_tag, duration = _ATTACK_FIELDS(data)
+        self.stars: int = stars
+        self.destruction: float = destruction
+        self.order: int = order
+        # tags repeat across every attack and defense in a war, so share one string object per tag.
+        self.attacker_tag: str = intern(attacker_tag)
+        self.defender_tag: str = intern(defender_tag)
+        self.duration: float = duration
 
     @property
     def attacker(self) -> "ClanWarMember":
@@ -117,8 +124,4 @@ class WarAttack:
     @property
     def is_fresh_attack(self) -> bool:
         """:class:`boolean`: Returns whether the attack is a fresh (first) attack on the defender."""
-        if len(self.defender.defenses) == 1:
-            # fast route
-            return True
-
-        return min(defense.order for defense in self.defender.defenses) == self.order
+        return self.order == self.defender._first_defense_order  # pylint: disable=protected-access
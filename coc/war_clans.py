@@ -23,6 +23,8 @@ SOFTWARE.
 """
 import typing
 
+from operator import attrgetter
+
 from .abc import BaseClan
 from .war_members import ClanWarMember, ClanWarLeagueClanMember
 from .utils import cached_property, correct_tag
@@ -75,7 +77,6 @@ class WarClan(BaseClan):
 
     __slots__ = (
         "destruction",
-        "level",
         "attacks_used",
         "stars",
         "exp_earned",
@@ -83,7 +84,6 @@ class WarClan(BaseClan):
         "total_attacks",
         "member_cls",
         "_war",
-        "_client",
 
         "_members",
         "_iter_members",
@@ -103,7 +103,6 @@ class WarClan(BaseClan):
     def _from_data(self, data: dict) -> None:
         data_get = data.get
 
-        self.level: int = data_get("clanLevel")
         self.destruction: float = data_get("destructionPercentage")
         self.exp_earned: int = data_get("expEarned")
         self.attacks_used: int = data_get("attacks")
@@ -126,7 +125,7 @@ class WarClan(BaseClan):
         """List[:class:`ClanWarMember`]: A list of members that are in the war.
         This is sorted by :attr:`ClanWarMember.map_position`
         """
-        dict_members = self._members = {m.tag: m for m in sorted(self._iter_members, key=lambda m: m.map_position)}
+        dict_members = self._members = {m.tag: m for m in sorted(self._iter_members, key=attrgetter("map_position"))}
         return list(dict_members.values())
 
     @property
@@ -145,7 +144,8 @@ class WarClan(BaseClan):
         for member in self.members:
             attacks.extend(member.attacks)
 
-        return list(sorted(attacks, key=lambda a: a.order, reverse=True))
+        attacks.sort(key=attrgetter("order"), reverse=True)
+        return attacks
 
     @cached_property("_cs_defenses")
     def defenses(self) -> typing.List["WarAttack"]:
@@ -199,7 +199,7 @@ class ClanWarLeagueClan(BaseClan):
         The clan's level.
     """
 
-    __slots__ = BaseClan.__slots__ + ("_cs_members", "_iter_members")
+    __slots__ = ("_cs_members", "_iter_members")
 
     def __init__(self, *, data, client):
         super().__init__(data=data, client=client)
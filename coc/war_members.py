@@ -23,7 +23,10 @@ SOFTWARE.
 """
 import typing
 
+from sys import intern
+
 from .abc import BasePlayer
+from .utils import cached_property
 from .war_attack import WarAttack
 
 if typing.TYPE_CHECKING:
@@ -58,8 +61,6 @@ class ClanWarMember(BasePlayer):
     """
 
     __slots__ = (
-        "tag",
-        "name",
         "town_hall",
         "defense_count",
         "__iter_attacks",
@@ -69,13 +70,12 @@ class ClanWarMember(BasePlayer):
         "war",
         "clan",
         "attack_cls",
-        "_client",
         "_attacks",
+        "_cs_first_defense_order",
     )
 
     def __init__(self, *, data, client, war, clan, **kwargs):
         super().__init__(data=data, client=client)
-        self._client = client
         self._attacks = []
         self.war = war  # type: ClanWar
         self.clan = clan  # type: WarClan
@@ -86,7 +86,8 @@ class ClanWarMember(BasePlayer):
         data_get = data.get
 
         self.name: str = data_get("name")
-        self.tag: str = data_get("tag")
+        tag = data_get("tag")
+        self.tag: str = tag and intern(tag)
         self.town_hall: int = data_get("townhallLevel")
         self.map_position: int = data_get("mapPosition")
         self.defense_count: int = data_get("opponentAttacks")
@@ -131,6 +132,11 @@ class ClanWarMember(BasePlayer):
         """List[:class:`WarAttack`]: The member's defenses this war. Could be an empty list."""
         return self.war.get_defenses(self.tag)
 
+    @cached_property("_cs_first_defense_order")
+    def _first_defense_order(self) -> typing.Optional[int]:
+        # the order of the first attack on this base, or ``None`` if it hasn't been attacked.
+        return min((defense.order for defense in self.defenses), default=None)
+
     @property
     def is_opponent(self) -> bool:
         """:class:`bool`: Indicates whether the member is from the opponent clan or not."""
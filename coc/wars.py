@@ -24,14 +24,16 @@ SOFTWARE.
 # Enables circular import for type hinting coc.Client
 from __future__ import annotations
 
+import heapq
 import itertools
 
-from typing import AsyncIterator, List, Optional, Type, TYPE_CHECKING, Union
+from operator import attrgetter
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type, TYPE_CHECKING, Union
 
 from .enums import BattleModifier, WarResult, WarRound, WarState
 from .iterators import LeagueWarIterator
 from .miscmodels import try_enum, Timestamp
-from .utils import cached_property, get
+from .utils import cached_property, correct_tag, get
 from .war_clans import WarClan, ClanWarLeagueClan
 from .war_attack import WarAttack
 
@@ -41,6 +43,29 @@ if TYPE_CHECKING:
     from .client import Client
 
 
+# possible lengths of preparation day, in seconds, for a friendly war.
+_PREP_SECONDS = frozenset((
+    5 * 60,
+    15 * 60,
+    30 * 60,
+    60 * 60,
+    2 * 60 * 60,
+    4 * 60 * 60,
+    6 * 60 * 60,
+    8 * 60 * 60,
+    12 * 60 * 60,
+    16 * 60 * 60,
+    20 * 60 * 60,
+    24 * 60 * 60,
+))
+
+# ClanWar.status labels for when the home clan is ahead, level or behind, keyed by war state.
+_STATUS_MATRIX = {
+    "inWar": ("winning", "tied", "losing"),
+    "warEnded": ("won", "tie", "lost"),
+}
+
+
 class ClanWar:
     """Represents a Current Clash of Clans War
 
@@ -90,6 +115,13 @@ class ClanWar:
         "_response_retry",
         "_raw_data",
         "battle_modifier",
+        "_cs_attacks",
+        "_cs_members",
+        "_cs_status",
+        "_cs_attack_index",
+        "_cs_member_index",
+        "_type",
+        "_is_cwl",
     )
 
     def __init__(self, *, data, client, **kwargs):
@@ -100,53 +132,64 @@ class ClanWar:
         self.clan_cls = kwargs.pop('clan_cls', WarClan)
         self._from_data(data)
 
-        self.clan_tag = self.clan and self.clan.tag or self.clan_tag
+        clan = self.clan
+        if clan is not None and clan.tag:
+            self.clan_tag = clan.tag
         self.league_group = kwargs.pop("league_group", None)
 
     def _from_data(self, data: dict) -> None:
         data_get = data.get
 
         self.state: WarState = try_enum(WarState, data=data_get("state"))
-        self.preparation_start_time = try_enum(Timestamp, data=data_get(
-            "preparationStartTime"))
-        self.start_time = try_enum(Timestamp, data=data_get("startTime"))
-        self.end_time = try_enum(Timestamp, data=data_get("endTime"))
+        # these are inlined rather than going through try_enum as this runs for every war loaded.
+        prep_time, start_time, end_time = data_get("preparationStartTime"), data_get("startTime"), data_get("endTime")
+        self.preparation_start_time = Timestamp(data=prep_time) if prep_time else None
+        self.start_time = Timestamp(data=start_time) if start_time else None
+        self.end_time = Timestamp(data=end_time) if end_time else None
         self.war_tag: str = data_get("tag")
         self.battle_modifier: BattleModifier = try_enum(BattleModifier, data=data_get('battleModifier', 'none'))
-        if data_get("attacksPerMember") is None or self.is_cwl:
+
+        if self.war_tag:
+            self._type = "cwl"
+        elif not (self.start_time and self.preparation_start_time):
+            self._type = None
+        elif (self.start_time.time - self.preparation_start_time.time).seconds in _PREP_SECONDS:
+            self._type = "friendly"
+        else:
+            self._type = "random"
+        self._is_cwl = self._type == "cwl"
+
+        attacks_per_member = data_get("attacksPerMember")
+        if attacks_per_member is None or self._is_cwl:
             self.attacks_per_member: int = 1
         else:
-            self.attacks_per_member: int = data_get("attacksPerMember")
+            self.attacks_per_member: int = attacks_per_member
 
-        self.team_size: int = data_get("teamSize") or len(
-            data_get("clan", {}).get("members", []))
+        clan_data, opponent_data = data_get("clan"), data_get("opponent")
+        self.team_size: int = data_get("teamSize") or len((clan_data or {}).get("members", []))
 
-        clan_data = data_get("clan")
         # annoying bug where if you request a war with a clan tag that clan could be the opponent or clan,
         # depending on the way the game stores it internally. This isn't very helpful as we always want it
         # from the perspective of the tag we provided, so switch them around if it isn't correct.
-        if clan_data and clan_data.get("tag", self.clan_tag) == self.clan_tag:
-            self.clan = try_enum(self.clan_cls, data=clan_data, client=self._client,
-                                 war=self)
-            self.opponent = try_enum(self.clan_cls, data=data_get("opponent"),
-                                     client=self._client, war=self)
-        else:
-            self.clan = try_enum(self.clan_cls, data=data_get("opponent"),
-                                 client=self._client, war=self)
-            self.opponent = try_enum(self.clan_cls, data=clan_data,
-                                     client=self._client, war=self)
+        if not (clan_data and clan_data.get("tag", self.clan_tag) == self.clan_tag):
+            clan_data, opponent_data = opponent_data, clan_data
 
-    @property
+        clan_cls, client = self.clan_cls, self._client
+        self.clan = clan_cls(data=clan_data, client=client, war=self) if clan_data else None
+        self.opponent = clan_cls(data=opponent_data, client=client, war=self) if opponent_data else None
+
+    @cached_property("_cs_attacks")
     def attacks(self) -> List[WarAttack]:
         """List[:class:`WarAttack`]: Returns all attacks this war, sorted by attack order."""
-        return sorted([*self.clan.attacks, *self.opponent.attacks],
-                      key=lambda x: x.order, reverse=True)
+        # both clans' attacks are already sorted by order, so merge them rather than re-sorting.
+        return list(heapq.merge(self.clan.attacks, self.opponent.attacks,
+                                key=attrgetter("order"), reverse=True))
 
-    @property
+    @cached_property("_cs_members")
     def members(self) -> List["ClanWarMember"]:
         """List[:class:`ClanWarMember`]: A list of members that are in the war."""
-        return sorted([*self.clan.members, *self.opponent.members],
-                      key=lambda x: (not x.is_opponent, x.map_position))
+        # each clan's members are already sorted by map position, and opponent members come first.
+        return [*self.opponent.members, *self.clan.members]
 
     @property
     def type(self) -> Optional[str]:
@@ -158,33 +201,9 @@ class ClanWar:
         5 minutes, 15 minutes, 30 minutes, 1 hour, 2 hours, 4 hours, 6 hours, 8 hours, 12 hours,
         16 hours, 20 hours or 24 hours.
         """
-        if self.war_tag:
-            return "cwl"
+        return self._type
 
-        if not self.start_time:
-            return None
-
-        prep_list = [
-            5 * 60,
-            15 * 60,
-            30 * 60,
-            60 * 60,
-            2 * 60 * 60,
-            4 * 60 * 60,
-            6 * 60 * 60,
-            8 * 60 * 60,
-            12 * 60 * 60,
-            16 * 60 * 60,
-            20 * 60 * 60,
-            24 * 60 * 60,
-        ]
-        if (
-                self.start_time.time - self.preparation_start_time.time).seconds in prep_list:
-            return "friendly"
-
-        return "random"
-
-    @property
+    @cached_property("_cs_status")
     def status(self) -> str:
         """:class:`str`: Returns the war status, based off the home clan.
 
@@ -200,37 +219,33 @@ class ClanWar:
         | ``losing`` | ``lost``    |
         +------------+-------------+
         """
-        # pylint: disable=too-many-return-statements
-        if self.state == "inWar":
-            if self.clan.stars > self.opponent.stars:
-                return "winning"
+        # a fresh ClanWar is built for every API response, so the stars and
+        # destruction this is based on can't change for the lifetime of the instance.
+        state = self.state
+        # WarState isn't hashable, so look up by its value rather than comparing against each state in turn.
+        labels = _STATUS_MATRIX.get(state and state.value)
+        if labels is None:
+            return ""
 
-            if self.clan.stars == self.opponent.stars:
-                if self.clan.destruction > self.opponent.destruction:
-                    return "winning"
-                if self.clan.destruction == self.opponent.destruction:
-                    return "tied"
+        winning, tied, losing = labels
 
-            return "losing"
+        clan_stars, opponent_stars = self.clan.stars, self.opponent.stars
+        if clan_stars > opponent_stars:
+            return winning
 
-        if self.state == "warEnded":
-            if self.clan.stars > self.opponent.stars:
-                return "won"
+        if clan_stars == opponent_stars:
+            clan_destruction, opponent_destruction = self.clan.destruction, self.opponent.destruction
+            if clan_destruction > opponent_destruction:
+                return winning
+            if clan_destruction == opponent_destruction:
+                return tied
 
-            if self.clan.stars == self.opponent.stars:
-                if self.clan.destruction > self.opponent.destruction:
-                    return "won"
-                if self.clan.destruction == self.opponent.destruction:
-                    return "tie"
-
-            return "lost"
-
-        return ""
+        return losing
 
     @property
     def is_cwl(self) -> bool:
         """:class:`bool`: Returns a boolean indicating if the war is a Clan War League (CWL) war."""
-        return self.type == "cwl"
+        return self._is_cwl
 
     def get_member(self, tag: str) -> Optional["ClanWarMember"]:
         """Return a :class:`ClanWarMember` with the tag provided. Returns ``None`` if not found.
@@ -246,13 +261,12 @@ class ClanWar:
         --------
         Optional[:class:`ClanWarMember`]: The member who matches the tag provided.
         """
+        return self._member_index.get(correct_tag(tag))
 
-        home_member = self.clan.get_member(tag)
-        if home_member:
-            return home_member
-
-        away_member = self.opponent.get_member(tag)
-        return away_member
+    @cached_property("_cs_member_index")
+    def _member_index(self) -> Dict[str, "ClanWarMember"]:
+        # home members go last so they win if a tag is somehow in both clans.
+        return {m.tag: m for m in (*self.opponent.members, *self.clan.members)}
 
     def get_member_by(self, **attrs) -> Optional["ClanWarMember"]:
         """Returns the first :class:`WarMember` that meets the attributes passed
@@ -267,6 +281,8 @@ class ClanWar:
 
         This search implements the :func:`coc.utils.get` function
         """
+        if attrs.keys() == {"tag"}:
+            return self._member_index.get(attrs["tag"])
         return get(self.members, **attrs)
 
     def get_attack(self, attacker_tag: str, defender_tag: str) -> Optional[
@@ -278,14 +294,14 @@ class ClanWar:
         Returns
         --------
         The attack with the correct attacker and defender tags: :class:`WarAttack`: """
-        attacker = self.get_member(attacker_tag)
-        if not attacker:
-            return None
+        return self._attack_index.get((correct_tag(attacker_tag), defender_tag))
 
-        attacks = attacker.attacks
-        if len(attacks) == 0:
-            return None
-        return get(attacks, defender_tag=defender_tag)
+    @cached_property("_cs_attack_index")
+    def _attack_index(self) -> Dict[Tuple[str, str], WarAttack]:
+        index = {}
+        for attack in (*self.clan.attacks, *self.opponent.attacks):
+            index.setdefault((attack.attacker_tag, attack.defender_tag), attack)
+        return index
 
     def get_defenses(self, defender_tag: str) -> List[WarAttack]:
         """Return a :class:`list` of :class:`WarAttack` for the defender tag provided.
@@ -370,10 +386,11 @@ class ClanWarLogEntry:
         self.opponent = self._fake_load_clan(data_get("opponent"))
         self.battle_modifier: BattleModifier = try_enum(BattleModifier, data=data_get('battleModifier', 'none'))
 
-        if data_get("attacksPerMember") is None and self.is_league_entry:
+        attacks_per_member = data_get("attacksPerMember")
+        if attacks_per_member is None and self.is_league_entry:
             self.attacks_per_member: int = 1
         else:
-            self.attacks_per_member: int = data_get("attacksPerMember")
+            self.attacks_per_member: int = attacks_per_member
 
     def _fake_load_clan(self, data):
         if not (data and data.get(
@@ -401,7 +418,7 @@ class ClanWarLeagueGroup:
     number_of_rounds:
         :class:`int`: The number of rounds this league group contains.
     rounds:
-        List[List[:class:`str`]]: A list of lists containing all war tags for each round.
+        List[Tuple[:class:`str`]]: A list of tuples containing all war tags for each round.
 
         .. note::
 
@@ -413,8 +430,7 @@ class ClanWarLeagueGroup:
 
     __slots__ = (
         "state", "season", "rounds", "number_of_rounds", "_client",
-        "__iter_clans",
-        "_cs_clans", "_raw_data")
+        "_clans", "_raw_data")
 
     def __repr__(self):
         attrs = [
@@ -439,16 +455,16 @@ class ClanWarLeagueGroup:
         self.number_of_rounds: int = len(rounds)
         # the API returns a list and the rounds that haven't started contain war tags of #0 (not sure why)...
         # we want to get only the valid rounds
-        self.rounds: List[List[str]] = [n["warTags"] for n in rounds if
-                                        n["warTags"][0] != "#0"]
+        war_tags = (tuple(n["warTags"]) for n in rounds)
+        self.rounds: List[Tuple[str, ...]] = [tags for tags in war_tags if tags[0] != "#0"]
 
-        self.__iter_clans = (ClanWarLeagueClan(data=data, client=self._client)
-                             for data in data_get("clans", []))
+        self._clans = [ClanWarLeagueClan(data=cdata, client=self._client)
+                       for cdata in data_get("clans", [])]
 
-    @cached_property("_cs_clans")
+    @property
     def clans(self) -> List[ClanWarLeagueClan]:
         """List[:class:`LeagueClan`]: Returns all participating clans."""
-        return list(self.__iter_clans)
+        return self._clans
 
     def get_wars_for_clan(self, clan_tag: str, cls: Type[ClanWar] = ClanWar) -> \
             AsyncIterator[ClanWar]:
@@ -479,7 +495,7 @@ class ClanWarLeagueGroup:
             A war in the current CWL season with the clan in it..
         """
         return LeagueWarIterator(client=self._client,
-                                 tags=itertools.chain(*self.rounds),
+                                 tags=itertools.chain.from_iterable(self.rounds),
                                  clan_tag=clan_tag, cls=cls)
 
     def get_wars(
@@ -1,6 +1,7 @@
+import copy
 import unittest
 
-from coc.wars import ClanWar
+from coc.wars import ClanWar, ClanWarLeagueGroup
 from coc.miscmodels import Timestamp
 
 from tests.mockdata.mock_current_war import MOCK_CURRENT_WAR_IN_WAR
@@ -60,6 +61,19 @@ class TestWars(unittest.TestCase):
 
             self.assertEqual(war.type, "random")
 
+    def test_type(self):
+        data = [
+            ({"preparationStartTime": "20200523T033025.000Z", "startTime": "20200523T043025.000Z"}, "friendly"),
+            ({"preparationStartTime": "20200522T051229.000Z", "startTime": "20200523T043025.000Z"}, "random"),
+            ({"tag": "#8LUL2Y90", "startTime": "20200523T043025.000Z"}, "cwl"),
+            ({"startTime": "20200523T043025.000Z"}, None),
+            ({}, None),
+        ]
+        for case, expected in data:
+            war = ClanWar(data=case, clan_tag="", client=None)
+            self.assertEqual(war.type, expected)
+            self.assertEqual(war.is_cwl, expected == "cwl")
+
 
 class TestWarClan(unittest.TestCase):
     def test_level(self):
@@ -96,3 +110,102 @@ class TestWarClan(unittest.TestCase):
         data = {"clan": {"clanLevel": 10}}
         war = ClanWar(data=data, client=None, clan_tag=None)
         self.assertIsInstance(war.clan.level, int)
+
+
+def _load_mock_war():
+    data = copy.deepcopy(MOCK_CURRENT_WAR_IN_WAR)
+    for side in ("clan", "opponent"):
+        for member in data[side]["members"]:
+            for attack in member.get("attacks", []):
+                attack.setdefault("duration", 0)
+    return ClanWar(data=data, client=None, clan_tag=data["clan"]["tag"])
+
+
+class TestClanWar(unittest.TestCase):
+    def test_attacks_sorted(self):
+        war = _load_mock_war()
+        orders = [attack.order for attack in war.attacks]
+        self.assertEqual(orders, sorted(orders, reverse=True))
+        self.assertEqual(len(war.attacks), len(war.clan.attacks) + len(war.opponent.attacks))
+        self.assertIs(war.attacks, war.attacks)
+
+    def test_members_sorted(self):
+        war = _load_mock_war()
+        expected = sorted([*war.clan.members, *war.opponent.members],
+                          key=lambda x: (not x.is_opponent, x.map_position))
+        self.assertEqual(war.members, expected)
+        self.assertIs(war.members, war.members)
+
+    def test_status(self):
+        war = _load_mock_war()
+        self.assertEqual(war.status, "losing")
+        self.assertIs(war.status, war.status)
+
+    def test_status_outcomes(self):
+        data = [
+            ("inWar", (10, 50.0), (5, 90.0), "winning"),
+            ("inWar", (10, 50.0), (10, 40.0), "winning"),
+            ("inWar", (10, 50.0), (10, 50.0), "tied"),
+            ("inWar", (10, 50.0), (10, 60.0), "losing"),
+            ("inWar", (5, 90.0), (10, 50.0), "losing"),
+            ("warEnded", (10, 50.0), (5, 90.0), "won"),
+            ("warEnded", (10, 50.0), (10, 50.0), "tie"),
+            ("warEnded", (10, 50.0), (10, 60.0), "lost"),
+            ("preparation", (0, 0.0), (0, 0.0), ""),
+        ]
+        for state, (clan_stars, clan_destruction), (opp_stars, opp_destruction), expected in data:
+            case = {
+                "state": state,
+                "clan": {"tag": "#8J8QJ2LV", "stars": clan_stars, "destructionPercentage": clan_destruction},
+                "opponent": {"tag": "#2Y8P2L0C", "stars": opp_stars, "destructionPercentage": opp_destruction},
+            }
+            war = ClanWar(data=case, client=None, clan_tag="#8J8QJ2LV")
+            self.assertEqual(war.status, expected)
+
+    def test_is_fresh_attack(self):
+        war = _load_mock_war()
+        for attack in war.attacks:
+            expected = min(defense.order for defense in attack.defender.defenses) == attack.order
+            self.assertEqual(attack.is_fresh_attack, expected)
+
+    def test_get_attack(self):
+        war = _load_mock_war()
+        for attack in war.attacks:
+            self.assertIs(war.get_attack(attack.attacker_tag, attack.defender_tag), attack)
+        attack = war.attacks[0]
+        self.assertIs(war.get_attack(attack.attacker_tag.lower(), attack.defender_tag), attack)
+        self.assertIsNone(war.get_attack(attack.attacker_tag, "#INVALID"))
+        self.assertIsNone(war.get_attack("#INVALID", attack.defender_tag))
+
+    def test_get_member(self):
+        war = _load_mock_war()
+        for member in war.members:
+            self.assertIs(war.get_member(member.tag), member)
+            self.assertIs(war.get_member_by(tag=member.tag), member)
+        member = war.clan.members[0]
+        self.assertIs(war.get_member(member.tag.lower()), member)
+        self.assertIs(war.get_member_by(tag=member.tag, name=member.name), member)
+        self.assertIsNone(war.get_member("#INVALID"))
+        self.assertIsNone(war.get_member_by(tag="#INVALID"))
+
+
+class TestClanWarLeagueGroup(unittest.TestCase):
+    def test_rounds(self):
+        data = {
+            "state": "inWar",
+            "season": "2020-05",
+            "rounds": [
+                {"warTags": ["#8LUL2Y90", "#URRJQ8Y"]},
+                {"warTags": ["#2Y8P2L0C", "#9VJ2G0U2"]},
+                {"warTags": ["#0", "#0"]},
+            ],
+        }
+        group = ClanWarLeagueGroup(data=data, client=None)
+        self.assertEqual(group.number_of_rounds, 3)
+        self.assertEqual(group.rounds, [("#8LUL2Y90", "#URRJQ8Y"), ("#2Y8P2L0C", "#9VJ2G0U2")])
+
+    def test_clans(self):
+        data = {"clans": [{"tag": "#8J8QJ2LV", "name": "Reddit Ace"}, {"tag": "#2Y8P2L0C", "name": "Reddit Zulu"}]}
+        group = ClanWarLeagueGroup(data=data, client=None)
+        self.assertEqual([clan.tag for clan in group.clans], ["#8J8QJ2LV", "#2Y8P2L0C"])
+        self.assertIs(group.clans, group.clans)